@@ -11,7 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from core.config_manager import ConfigManager
-from core.analyzer import AILiteratureAnalyzer
+from core.analyzer import AILiteratureAnalyzer, list_pdf_files
 from utils.progress_monitor import ProgressMonitor
 
 
@@ -26,7 +26,7 @@ def example_basic_usage():
     analyzer = AILiteratureAnalyzer(config)
     
     # 3. 检查输入目录
-    pdf_files = list(analyzer.input_dir.glob("*.pdf"))
+    pdf_files = list_pdf_files(analyzer.input_dir)
     print(f"📚 发现 {len(pdf_files)} 个PDF文件")
     
     if pdf_files:
@@ -99,7 +99,7 @@ def example_batch_analysis():
     analyzer = AILiteratureAnalyzer(config)
     
     # 检查可分析的文件
-    pdf_files = list(analyzer.input_dir.glob("*.pdf"))
+    pdf_files = list_pdf_files(analyzer.input_dir)
     print(f"📚 找到 {len(pdf_files)} 个PDF文件")
     
     if len(pdf_files) > 0:
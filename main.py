@@ -18,7 +18,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from core.config_manager import ConfigManager
-from core.analyzer import AILiteratureAnalyzer
+from core.analyzer import AILiteratureAnalyzer, list_pdf_files
 from utils.progress_monitor import check_progress, ProgressMonitor
 
 
@@ -34,6 +34,9 @@ def main():
   python main.py --analyze --limit 5       # 分析前5篇论文
   python main.py --progress                # 检查分析进度
   python main.py --monitor                 # 持续监控进度
+  python main.py --analyze --async         # 异步并发分析
+  python main.py --analyze --batch-mode    # 使用API批处理接口离线分析
+  python main.py --analyze --no-cache      # 忽略缓存重新分析
   python main.py --config custom.yaml     # 使用自定义配置
         """
     )
@@ -50,6 +53,15 @@ def main():
     parser.add_argument("--limit", "-l", type=int,
                        help="限制分析的论文数量")
     
+    # 异步模式与批处理模式只能二选一
+    mode_group = parser.add_mutually_exclusive_group()
+    mode_group.add_argument("--async", dest="use_async", action="store_true",
+                           help="异步并发调用API (需要安装httpx)")
+    mode_group.add_argument("--batch-mode", action="store_true",
+                           help="通过API批处理接口离线提交 (延迟高、费用低)")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="忽略已缓存的API响应，强制重新分析")
+    
     # 监控选项
     parser.add_argument("--progress", "-p", action="store_true",
                        help="检查当前分析进度")
@@ -100,10 +112,10 @@ def main():
                 
         elif args.test:
             # 测试模式
-            analyzer = AILiteratureAnalyzer(config_manager)
+            analyzer = AILiteratureAnalyzer(config_manager, refresh_cache=args.no_cache)
             
             # 查找第一个PDF文件进行测试
-            pdf_files = list(analyzer.input_dir.glob("*.pdf"))
+            pdf_files = list_pdf_files(analyzer.input_dir)
             if not pdf_files:
                 print(f"❌ 在输入目录中未找到PDF文件: {analyzer.input_dir}")
                 print("请将PDF文件放入 data/input/ 目录")
@@ -123,10 +135,10 @@ def main():
                     
         elif args.analyze:
             # 批量分析
-            analyzer = AILiteratureAnalyzer(config_manager)
+            analyzer = AILiteratureAnalyzer(config_manager, refresh_cache=args.no_cache)
             
             # 检查输入目录是否有PDF文件
-            pdf_files = list(analyzer.input_dir.glob("*.pdf"))
+            pdf_files = list_pdf_files(analyzer.input_dir)
             if not pdf_files:
                 print(f"❌ 在输入目录中未找到PDF文件: {analyzer.input_dir}")
                 print("请将PDF文件放入 data/input/ 目录")
@@ -137,7 +149,8 @@ def main():
                 print(f"🔢 限制分析数量: {args.limit}")
             
             # 开始批量分析
-            results = analyzer.batch_analyze_papers(args.limit)
+            results = analyzer.batch_analyze_papers(args.limit, use_async=args.use_async,
+                                                   batch_mode=args.batch_mode)
             
             # 显示结果摘要
             print(f"\n📊 分析完成摘要:")
@@ -158,7 +171,7 @@ def main():
             # 检查输入目录中的文件
             input_dir = Path(paths_config['input_dir'])
             if input_dir.exists():
-                pdf_files = list(input_dir.glob("*.pdf"))
+                pdf_files = list_pdf_files(input_dir)
                 print(f"📚 发现 {len(pdf_files)} 个PDF文件")
             else:
                 print("⚠️ 输入目录不存在，请先创建并添加PDF文件")
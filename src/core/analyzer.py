@@ -11,27 +11,150 @@ Licensed under the MIT License. See LICENSE file for details.
 import os
 import json
 import re
-import requests
-import time
+import hashlib
+import string
+import tempfile
+import threading
+import multiprocessing
+import asyncio
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-import PyPDF2
-import pdfplumber
+from typing import Dict, List, Optional, Any, Tuple
 import logging
+import functools
+import diskcache
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 
 from .config_manager import ConfigManager
 
+ANALYSIS_SYSTEM_PROMPT = "你是一个模型轻量化领域的专家，专门分析深度学习模型压缩和优化相关的学术论文。你的分析深入、客观、专业。"
+METHOD_CARD_SYSTEM_PROMPT = "你是一个技术文档专家，专门生成清晰简洁的技术方法卡片。"
+
+# 页数达到该值时才启用多进程按页并行提取，避免短论文承担进程启动开销
+MIN_PAGES_FOR_PARALLEL = 8
+
+# PDF文本缓存格式版本，提取结果的格式变化时递增，使旧缓存失效
+TEXT_CACHE_VERSION = 2
+
+# 需要重试的HTTP状态码（同步会话与异步调用共用同一重试策略）
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# 异步调用的退避等待上限（秒），与urllib3默认值一致
+RETRY_BACKOFF_MAX = 120
+
+# PDFium不是线程安全的：同一进程内的所有pdfium调用都需持有该锁（线程池/异步模式下会并发提取）
+_PDFIUM_LOCK = threading.Lock()
+
+# 按页并行提取共用的进程池，首次使用时创建
+_PAGE_POOL: Optional[ProcessPoolExecutor] = None
+_PAGE_POOL_LOCK = threading.Lock()
+
+
+def list_pdf_files(directory: Path) -> List[Path]:
+    """列出目录中的PDF文件（单次scandir遍历，按文件名排序）"""
+    with os.scandir(directory) as entries:
+        pdf_files = [Path(entry.path) for entry in entries
+                     if entry.name.lower().endswith(".pdf") and entry.is_file()]
+    return sorted(pdf_files)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_token_encoding(name: str = "cl100k_base"):
+    """加载并缓存tiktoken编码器；tiktoken不可用时返回None（回退为按字符截断）"""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding(name)
+    except Exception as e:
+        logging.getLogger('AILiteratureAnalyzer').warning(f"tiktoken不可用，按字符数截断文本: {e}")
+        return None
+
+
+def _compile_template(template: str) -> Optional[List[Tuple[str, Optional[str]]]]:
+    """
+    将提示词模板预解析为 (字面文本, 占位符名) 片段列表，避免每次调用都重新解析
+    
+    Returns:
+        片段列表；模板包含格式说明、转换符或位置参数等复杂用法时返回None
+    """
+    pieces = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if field is not None and (spec or conversion or not field.isidentifier()):
+            return None
+        pieces.append((literal, field))
+    return pieces
+
+
+def _render_template(template: str, pieces: Optional[List[Tuple[str, Optional[str]]]], **values: str) -> str:
+    """按预解析的片段填充模板，结果与 template.format(**values) 一致"""
+    if pieces is None:
+        return template.format(**values)
+    return "".join(literal if field is None else literal + values[field] for literal, field in pieces)
+
+
+def _pdfium_page_texts(pdf, start: int, stop: int):
+    """
+    逐页提取文本，用完立即关闭页面对象，避免在持锁范围之外由垃圾回收释放
+    
+    PDFium以CRLF分行，这里统一为LF，与pdfplumber/PyPDF2的输出保持一致
+    """
+    for i in range(start, stop):
+        page = pdf[i]
+        textpage = page.get_textpage()
+        try:
+            yield textpage.get_text_range().replace("\r\n", "\n")
+        finally:
+            textpage.close()
+            page.close()
+
+
+def _get_page_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    获取按页并行提取使用的共享进程池
+    
+    使用spawn方式启动子进程：提取可能发生在线程池的工作线程中，fork会让子进程继承
+    其他线程正在使用中的PDFium状态，导致崩溃或死锁
+    """
+    global _PAGE_POOL
+    with _PAGE_POOL_LOCK:
+        if _PAGE_POOL is None:
+            _PAGE_POOL = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        return _PAGE_POOL
+
+
+def _reset_page_pool(pool: ProcessPoolExecutor):
+    """进程池损坏（如子进程崩溃）后丢弃，下次使用时重新创建"""
+    global _PAGE_POOL
+    with _PAGE_POOL_LOCK:
+        if _PAGE_POOL is pool:
+            _PAGE_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _pdfium_extract_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """在独立进程中提取指定页范围的文本（PDFium不支持多线程并发访问）"""
+    import pypdfium2 as pdfium
+    
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        return list(_pdfium_page_texts(pdf, start, stop))
+    finally:
+        pdf.close()
+
 
 class AILiteratureAnalyzer:
     """AI驱动的文献分析器"""
     
-    def __init__(self, config_manager: ConfigManager):
+    # 文件名中需要去除的字符，以及需要替换为下划线的连续空白
+    _UNSAFE_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+    _WHITESPACE_RE = re.compile(r'\s+')
+    
+    def __init__(self, config_manager: ConfigManager, refresh_cache: bool = False):
         """
         初始化分析器
         
         Args:
             config_manager: 配置管理器实例
+            refresh_cache: 为True时忽略已缓存的API响应，强制重新调用并刷新缓存
         """
         self.config = config_manager
         
@@ -55,12 +178,29 @@ class AILiteratureAnalyzer:
         self.summaries_dir = Path(paths_config['summaries_dir'])
         self.method_cards_dir = Path(paths_config['method_cards_dir'])
         self.batch_reports_dir = Path(paths_config['batch_reports_dir'])
+        self.cache_dir = Path(paths_config['cache_dir'])
         
         # 处理配置
         processing_config = self.config.get_processing_config()
         self.max_text_length = processing_config['max_text_length']
+        self.max_input_tokens = processing_config.get('max_input_tokens', 0)
+        # 按字符截断时，提取到足够的文本即可停止解析后续页面（按Token截断时无法预知所需字符数）
+        self.extract_char_limit = self.max_text_length if self.max_input_tokens <= 0 else 0
         self.extract_pages = processing_config['extract_pages']
         self.skip_analyzed = processing_config['skip_analyzed']
+        self.parallel_workers = max(1, processing_config.get('parallel_workers', 1))
+        self.parallel_backend = processing_config.get('parallel_backend', 'thread')
+        self.async_concurrency = max(1, processing_config.get('async_concurrency', 8))
+        self.page_workers = max(1, processing_config.get('page_workers', 1))
+        self.batch_llm_size = max(1, processing_config.get('batch_llm_size', 1))
+        
+        # 输出配置（加载后不会变化，缓存为属性避免重复查找）
+        output_config = self.config.get_output_config()
+        self.summary_suffix = output_config['summary_suffix']
+        self.method_card_suffix = output_config['method_card_suffix']
+        self.include_metadata = output_config.get('include_metadata', True)
+        self.enable_cache = processing_config.get('enable_cache', True)
+        self.refresh_cache = refresh_cache
         
         # 创建必要目录
         self.config.create_directories()
@@ -68,9 +208,26 @@ class AILiteratureAnalyzer:
         # 设置日志
         self._setup_logging()
         
+        # 复用HTTP连接（keep-alive），避免每次调用重新TLS握手
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self._session = self._create_session()
+        
+        # API响应缓存
+        self._llm_cache = diskcache.Cache(str(self.cache_dir / "llm")) if self.enable_cache else None
+        
+        # PDF文本缓存
+        self.text_cache_dir = self.cache_dir / "text"
+        if self.enable_cache:
+            self.text_cache_dir.mkdir(parents=True, exist_ok=True)
+        
         # 加载提示词模板
         self.analysis_template = self.config.load_prompt_template('analysis')
         self.method_card_template = self.config.load_prompt_template('method_card')
+        self._analysis_pieces = _compile_template(self.analysis_template)
+        self._method_card_pieces = _compile_template(self.method_card_template)
         
         self.logger.info(f"AI文献分析系统已启动")
         self.logger.info(f"使用模型: {self.model}")
@@ -107,105 +264,351 @@ class AILiteratureAnalyzer:
             console_handler.setFormatter(formatter)
             self.logger.addHandler(console_handler)
     
-    def extract_pdf_text(self, pdf_path: Path) -> str:
-        """从PDF提取文本"""
-        text = ""
+    def _create_session(self):
+        """创建带连接池和自动重试的HTTP会话"""
+        # 延迟导入，--progress/--help等命令无需加载
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+        
+        # 由urllib3负责重试：指数退避，并遵循服务端的Retry-After
+        # max_retries为总尝试次数，与原先的重试循环保持一致
+        retry = Retry(
+            total=max(self.max_retries - 1, 0),
+            backoff_factor=self.retry_delay,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=["GET", "POST"],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
         
+        session = requests.Session()
+        pool_size = max(self.parallel_workers, 10)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self._headers)
+        return session
+    
+    def _pdf_digest(self, pdf_path: Path) -> str:
+        """流式计算PDF内容的SHA1，避免将整个文件读入内存"""
+        with open(pdf_path, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                return hashlib.file_digest(f, 'sha1').hexdigest()
+            
+            h = hashlib.sha1()
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                h.update(chunk)
+            return h.hexdigest()
+    
+    def extract_pdf_text(self, pdf_path: Path) -> str:
+        """从PDF提取文本（优先使用本地缓存的提取结果）"""
+        if not self.enable_cache:
+            return self._parse_pdf_text(pdf_path)
+        
+        # 缓存键包含文件内容哈希、缓存格式版本、提取页数和提取字符上限，任一变化都会使缓存失效
+        digest = self._pdf_digest(pdf_path)
+        cache_name = f"{digest[:16]}_v{TEXT_CACHE_VERSION}_{self.extract_pages}"
+        if self.extract_char_limit:
+            cache_name += f"_{self.extract_char_limit}"
+        cache_file = self.text_cache_dir / f"{cache_name}.txt"
+        if cache_file.exists():
+            self.logger.info("使用缓存的PDF文本: %s", pdf_path.name)
+            return cache_file.read_text(encoding='utf-8')
+        
+        text = self._parse_pdf_text(pdf_path)
+        if text:
+            self._write_text_cache(cache_file, text)
+        return text
+    
+    def _write_text_cache(self, cache_file: Path, text: str):
+        """先写入临时文件再原子替换，中断或并发写入时不会留下不完整的缓存"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.text_cache_dir, prefix=f"{cache_file.stem}.", suffix=".tmp")
         try:
-            # 首先尝试pdfplumber（更精确）
-            with pdfplumber.open(pdf_path) as pdf:
-                pages_to_extract = len(pdf.pages)
-                if self.extract_pages > 0:
-                    pages_to_extract = min(self.extract_pages, len(pdf.pages))
-                
-                for i in range(pages_to_extract):
-                    page_text = pdf.pages[i].extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                        
-            if not text.strip():
-                raise Exception("pdfplumber未提取到文本")
-                
-        except Exception as e:
-            self.logger.warning(f"pdfplumber失败，尝试PyPDF2: {e}")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(text.encode('utf-8'))
+            os.replace(tmp_path, cache_file)
+        except BaseException:
             try:
-                with open(pdf_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    pages_to_extract = len(pdf_reader.pages)
-                    if self.extract_pages > 0:
-                        pages_to_extract = min(self.extract_pages, len(pdf_reader.pages))
-                    
-                    for i in range(pages_to_extract):
-                        text += pdf_reader.pages[i].extract_text() + "\n"
-            except Exception as e2:
-                self.logger.error(f"PDF文本提取完全失败: {e2}")
-                return ""
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _parse_pdf_text(self, pdf_path: Path) -> str:
+        """解析PDF并提取文本，依次尝试pypdfium2、pdfplumber、PyPDF2"""
+        extractors = [
+            ("pypdfium2", self._extract_with_pdfium),
+            ("pdfplumber", self._extract_with_pdfplumber),
+            ("PyPDF2", self._extract_with_pypdf2)
+        ]
+        
+        for name, extractor in extractors:
+            try:
+                text = extractor(pdf_path).strip()
+                if text:
+                    return text
+                self.logger.warning("%s未提取到文本，尝试下一种方式", name)
+            except Exception as e:
+                self.logger.warning("%s提取失败，尝试下一种方式: %s", name, e)
         
-        return text.strip()
+        self.logger.error("PDF文本提取完全失败: %s", pdf_path.name)
+        return ""
     
-    def call_ai_api(self, messages: List[Dict[str, str]]) -> str:
-        """调用AI API"""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+    def _pages_to_extract(self, total_pages: int) -> int:
+        """根据extract_pages配置计算需要提取的页数"""
+        if self.extract_pages > 0:
+            return min(self.extract_pages, total_pages)
+        return total_pages
+    
+    def _join_pages(self, page_texts) -> str:
+        """
+        拼接各页文本；累计文本达到extract_char_limit后停止，后续页面不再解析
         
-        data = {
+        Args:
+            page_texts: 按页惰性产生文本的可迭代对象
+        """
+        pages = []
+        collected = 0
+        for page_text in page_texts:
+            pages.append(page_text)
+            # 按去除首尾空白后的长度累计，保证截断结果与完整提取后再截断一致
+            collected += len(page_text.strip())
+            if self.extract_char_limit and collected >= self.extract_char_limit:
+                break
+        return "\n".join(pages)
+    
+    def _extract_with_pdfium(self, pdf_path: Path) -> str:
+        """使用pypdfium2（PDFium C++绑定）提取文本，速度最快"""
+        # 延迟导入以加快CLI启动
+        import pypdfium2 as pdfium
+        
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(pdf_path)
+            try:
+                n = self._pages_to_extract(len(pdf))
+                if self.extract_char_limit or self.page_workers <= 1 or n < MIN_PAGES_FOR_PARALLEL:
+                    page_texts = _pdfium_page_texts(pdf, 0, n)
+                    try:
+                        return self._join_pages(page_texts)
+                    finally:
+                        # 提前停止时关闭生成器，确保当前页在文档关闭前释放
+                        page_texts.close()
+            finally:
+                pdf.close()
+        
+        # 需要提取全部页面且页数较多时，按页范围分块交给多个进程并行提取
+        workers = min(self.page_workers, n)
+        bounds = [n * k // workers for k in range(workers + 1)]
+        pool = _get_page_pool(self.page_workers)
+        try:
+            chunks = pool.map(_pdfium_extract_range, [str(pdf_path)] * workers, bounds[:-1], bounds[1:])
+            return "\n".join(text for chunk in chunks for text in chunk)
+        except BrokenProcessPool:
+            _reset_page_pool(pool)
+            raise
+    
+    def _extract_with_pdfplumber(self, pdf_path: Path) -> str:
+        """使用pdfplumber提取文本"""
+        import pdfplumber
+        
+        with pdfplumber.open(pdf_path) as pdf:
+            n = self._pages_to_extract(len(pdf.pages))
+            return self._join_pages(pdf.pages[i].extract_text() or "" for i in range(n))
+    
+    def _extract_with_pypdf2(self, pdf_path: Path) -> str:
+        """使用PyPDF2提取文本"""
+        import PyPDF2
+        
+        with open(pdf_path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            n = self._pages_to_extract(len(pdf_reader.pages))
+            return self._join_pages(pdf_reader.pages[i].extract_text() or "" for i in range(n))
+    
+    def _llm_cache_key(self, messages: List[Dict[str, str]], max_tokens: Optional[int] = None) -> str:
+        """根据模型、提示词和生成参数计算缓存键"""
+        payload = json.dumps({
             "model": self.model,
             "messages": messages,
             "temperature": self.temperature,
-            "max_tokens": self.max_tokens
+            "max_tokens": max_tokens or self.max_tokens
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _lookup_llm_cache(self, messages: List[Dict[str, str]], max_tokens: Optional[int] = None):
+        """
+        查询API响应缓存
+        
+        Returns:
+            (缓存的响应或None, 缓存键或None)
+        """
+        if self._llm_cache is None:
+            return None, None
+        
+        key = self._llm_cache_key(messages, max_tokens)
+        if self.refresh_cache:
+            return None, key
+        
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            self.logger.info("命中API响应缓存，跳过API调用")
+        return cached, key
+    
+    def _store_llm_cache(self, key: Optional[str], response: str):
+        """写入API响应缓存"""
+        if key is not None and response:
+            self._llm_cache.set(key, response)
+    
+    def _build_request_data(self, messages: List[Dict[str, str]], max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """构建API请求体，max_tokens为空时使用配置值"""
+        return {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": max_tokens or self.max_tokens
         }
+    
+    def call_ai_api(self, messages: List[Dict[str, str]], max_tokens: Optional[int] = None,
+                    allow_truncated: bool = True) -> str:
+        """
+        调用AI API（优先使用本地缓存的响应）
+        
+        Args:
+            messages: 对话消息
+            max_tokens: 本次请求的最大输出长度，为空时使用配置值
+            allow_truncated: 为False时，因达到max_tokens而被截断的输出视为失败（返回空字符串且不缓存）
+        """
+        cached, key = self._lookup_llm_cache(messages, max_tokens)
+        if cached is not None:
+            return cached
+        
+        response = self._request_ai_api(messages, max_tokens, allow_truncated)
+        self._store_llm_cache(key, response)
+        return response
+    
+    def _request_ai_api(self, messages: List[Dict[str, str]], max_tokens: Optional[int] = None,
+                        allow_truncated: bool = True) -> str:
+        """实际发送AI API请求"""
+        data = self._build_request_data(messages, max_tokens)
+        
+        try:
+            response = self._session.post(
+                f"{self.api_base}/chat/completions",
+                json=data,
+                timeout=self.timeout
+            )
+            
+            retries = response.raw.retries
+            if retries is not None and retries.history:
+                self.logger.warning("API调用经过 %d 次重试", len(retries.history))
+            
+            if response.status_code == 200:
+                choice = response.json()["choices"][0]
+                if not allow_truncated and choice.get("finish_reason") == "length":
+                    self.logger.warning("API输出达到max_tokens上限被截断")
+                    return ""
+                return choice["message"]["content"]
+            
+            self.logger.error("API调用失败: %s", response.status_code)
+            self.logger.error("错误信息: %s", response.text)
+        
+        except Exception as e:
+            self.logger.error("API调用异常: %s", e)
+        
+        return ""
+    
+    @staticmethod
+    def _parse_retry_after(response) -> Optional[float]:
+        """解析响应中的Retry-After头（秒数或HTTP日期），不存在或无效时返回None"""
+        from urllib3.util import Retry
+        
+        value = response.headers.get("Retry-After")
+        if value is None or response.status_code not in Retry.RETRY_AFTER_STATUS_CODES:
+            return None
+        try:
+            return Retry().parse_retry_after(value)
+        except Exception:
+            return None
+    
+    async def _call_ai_api_async(self, client, messages: List[Dict[str, str]]) -> str:
+        """异步调用AI API（与call_ai_api共用缓存）"""
+        cached, key = self._lookup_llm_cache(messages)
+        if cached is not None:
+            return cached
+        
+        data = self._build_request_data(messages)
         
         for attempt in range(self.max_retries):
+            delay = None
             try:
-                self.logger.info(f"API调用尝试 {attempt + 1}/{self.max_retries}")
-                response = requests.post(
-                    f"{self.api_base}/chat/completions",
-                    headers=headers,
-                    json=data,
-                    timeout=self.timeout
-                )
+                response = await client.post(f"{self.api_base}/chat/completions", json=data)
                 
                 if response.status_code == 200:
-                    result = response.json()
-                    return result["choices"][0]["message"]["content"]
-                else:
-                    self.logger.error(f"API调用失败: {response.status_code}")
-                    self.logger.error(f"错误信息: {response.text}")
-                    if attempt < self.max_retries - 1:
-                        self.logger.info(f"等待{self.retry_delay}秒后重试...")
-                        time.sleep(self.retry_delay)
-                    continue
-                    
+                    content = response.json()["choices"][0]["message"]["content"]
+                    self._store_llm_cache(key, content)
+                    return content
+                
+                self.logger.error("API调用失败: %s", response.status_code)
+                self.logger.error("错误信息: %s", response.text)
+                
+                # 与同步会话一致：仅429/5xx重试，其余状态（如400/401）重试无意义
+                if response.status_code not in RETRY_STATUS_CODES:
+                    return ""
+                delay = self._parse_retry_after(response)
+            
             except Exception as e:
-                self.logger.error(f"API调用异常 (尝试 {attempt + 1}): {e}")
-                if attempt < self.max_retries - 1:
-                    self.logger.info(f"等待{self.retry_delay}秒后重试...")
-                    time.sleep(self.retry_delay)
-                continue
+                self.logger.error("API调用异常 (尝试 %d): %s", attempt + 1, e)
+            
+            if attempt < self.max_retries - 1:
+                if delay is None:
+                    # 指数退避，与urllib3的backoff_factor计算方式相同
+                    delay = min(self.retry_delay * 2 ** attempt, RETRY_BACKOFF_MAX)
+                self.logger.info("等待%s秒后重试...", delay)
+                await asyncio.sleep(delay)
         
         self.logger.error("所有重试都失败了")
         return ""
     
-    def analyze_paper_with_ai(self, pdf_text: str, pdf_filename: str) -> Dict[str, Any]:
-        """使用AI分析论文"""
-        self.logger.info("正在进行AI深度分析...")
-        
-        # 限制文本长度
-        content = pdf_text[:self.max_text_length]
+    def _truncate_text(self, pdf_text: str) -> str:
+        """限制发送给AI的文本长度：配置了max_input_tokens时按Token数截断，否则按字符数"""
+        if self.max_input_tokens > 0:
+            encoding = _get_token_encoding()
+            if encoding is not None:
+                tokens = encoding.encode(pdf_text, disallowed_special=())
+                return encoding.decode(tokens[:self.max_input_tokens])
+        
+        return pdf_text[:self.max_text_length]
+    
+    def _build_analysis_messages(self, pdf_text: str, pdf_filename: str) -> List[Dict[str, str]]:
+        """构建论文分析的对话消息"""
+        content = self._truncate_text(pdf_text)
         
         # 构建分析提示词
-        analysis_prompt = self.analysis_template.format(
+        analysis_prompt = _render_template(
+            self.analysis_template, self._analysis_pieces,
             filename=pdf_filename,
             content=content
         )
         
-        messages = [
-            {"role": "system", "content": "你是一个模型轻量化领域的专家，专门分析深度学习模型压缩和优化相关的学术论文。你的分析深入、客观、专业。"},
+        return [
+            {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
             {"role": "user", "content": analysis_prompt}
         ]
+    
+    def _build_method_card_messages(self, analysis: str) -> List[Dict[str, str]]:
+        """构建方法卡片生成的对话消息"""
+        method_prompt = _render_template(self.method_card_template, self._method_card_pieces, analysis=analysis)
+        
+        return [
+            {"role": "system", "content": METHOD_CARD_SYSTEM_PROMPT},
+            {"role": "user", "content": method_prompt}
+        ]
+    
+    def analyze_paper_with_ai(self, pdf_text: str, pdf_filename: str) -> Dict[str, Any]:
+        """使用AI分析论文"""
+        self.logger.info("正在进行AI深度分析...")
         
+        messages = self._build_analysis_messages(pdf_text, pdf_filename)
         ai_response = self.call_ai_api(messages)
         
         if not ai_response:
@@ -213,47 +616,133 @@ class AILiteratureAnalyzer:
         
         return {"analysis": ai_response, "success": True}
     
-    def generate_method_card_with_ai(self, analysis: str, pdf_filename: str) -> str:
-        """使用AI生成方法卡片"""
-        self.logger.info("生成方法卡片...")
+    def analyze_papers_batch(self, papers: List[Tuple[str, str]], k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        将多篇论文合并到同一次API请求中分析，减少请求次数
+        
+        Args:
+            papers: (文件名, PDF文本) 列表
+            k: 每次请求包含的论文数，默认为 processing.batch_llm_size
+        
+        Returns:
+            与papers一一对应的分析结果，格式同analyze_paper_with_ai
+        """
+        k = k or self.batch_llm_size
+        results = []
+        
+        for start in range(0, len(papers), k):
+            chunk = papers[start:start + k]
+            analyses = self._request_batch_analysis(chunk) if len(chunk) > 1 else None
+            
+            if analyses is None:
+                if len(chunk) > 1:
+                    self.logger.warning("合并分析的结果无法拆分，改为逐篇分析")
+                results.extend(self.analyze_paper_with_ai(text, name) for name, text in chunk)
+            else:
+                results.extend({"analysis": analysis, "success": True} for analysis in analyses)
         
-        method_prompt = self.method_card_template.format(analysis=analysis)
+        return results
+    
+    def _request_batch_analysis(self, papers: List[Tuple[str, str]]) -> Optional[List[str]]:
+        """发送合并分析请求，并按分隔符拆分结果；数量不匹配时返回None"""
+        self.logger.info("正在合并分析 %d 篇论文...", len(papers))
+        
+        blocks = [
+            f"以下共有{len(papers)}篇论文，请按照每篇论文各自的要求分别进行分析。",
+            f"每篇论文的分析必须以单独一行的\"=== ANALYSIS 序号 ===\"开头，序号与论文序号一致。",
+            ""
+        ]
+        for i, (name, text) in enumerate(papers, 1):
+            user_prompt = self._build_analysis_messages(text, name)[-1]["content"]
+            blocks.append(f"=== PAPER {i} ({name}) ===\n{user_prompt}\n")
         
         messages = [
-            {"role": "system", "content": "你是一个技术文档专家，专门生成清晰简洁的技术方法卡片。"},
-            {"role": "user", "content": method_prompt}
+            {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
+            {"role": "user", "content": "\n".join(blocks)}
         ]
         
+        # 每篇论文各自需要一份输出长度；输出被截断时末尾的分析不完整，按拆分失败处理
+        response = self.call_ai_api(messages, max_tokens=self.max_tokens * len(papers), allow_truncated=False)
+        if not response:
+            return None
+        
+        # 拆分结果: [前言, 序号1, 分析1, 序号2, 分析2, ...]
+        parts = re.split(r"^\s*=== ANALYSIS (\d+) ===\s*$", response, flags=re.MULTILINE)
+        indices = [int(i) for i in parts[1::2]]
+        analyses = [part.strip() for part in parts[2::2]]
+        
+        if indices != list(range(1, len(papers) + 1)) or not all(analyses):
+            return None
+        return analyses
+    
+    def generate_method_card_with_ai(self, analysis: str, pdf_filename: str) -> str:
+        """使用AI生成方法卡片"""
+        self.logger.info("生成方法卡片...")
+        
+        messages = self._build_method_card_messages(analysis)
         return self.call_ai_api(messages)
     
-    def is_already_analyzed(self, pdf_path: Path) -> bool:
+    def is_already_analyzed(self, pdf_path: Path, safe_name: Optional[str] = None) -> bool:
         """检查文件是否已经分析过"""
         if not self.skip_analyzed:
             return False
         
-        safe_name = self._safe_filename(pdf_path.stem)
-        output_config = self.config.get_output_config()
-        suffix = output_config['summary_suffix']
-        
-        analysis_file = self.summaries_dir / f"{safe_name}{suffix}.md"
+        safe_name = safe_name or self._safe_filename(pdf_path.stem)
+        analysis_file = self.summaries_dir / f"{safe_name}{self.summary_suffix}.md"
         return analysis_file.exists()
     
-    def analyze_single_paper(self, pdf_path: Path) -> Dict[str, Any]:
-        """分析单篇论文"""
-        self.logger.info(f"开始分析: {pdf_path.name}")
+    def _partition_analyzed(self, pdf_files: List[Path], name_map: Dict[Path, str]):
+        """
+        一次扫描输出目录，将论文分为待分析和已分析两组
+        
+        Args:
+            pdf_files: PDF文件列表
+            name_map: PDF路径 -> 安全文件名
+        
+        Returns:
+            (待分析的文件列表, 已分析的文件列表)
+        """
+        if not self.skip_analyzed:
+            return pdf_files, []
+        
+        existing = {entry.name for entry in os.scandir(self.summaries_dir)}
+        
+        pending, analyzed = [], []
+        for pdf_path in pdf_files:
+            if f"{name_map[pdf_path]}{self.summary_suffix}.md" in existing:
+                analyzed.append(pdf_path)
+            else:
+                pending.append(pdf_path)
+        return pending, analyzed
+    
+    def analyze_single_paper(self, pdf_path: Path, safe_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        分析单篇论文
+        
+        Args:
+            pdf_path: PDF文件路径
+            safe_name: 预先计算的安全文件名，为空时根据文件名生成
+        """
+        safe_name = safe_name or self._safe_filename(pdf_path.stem)
         
         # 检查是否已分析
-        if self.is_already_analyzed(pdf_path):
-            self.logger.info(f"跳过已分析的文件: {pdf_path.name}")
+        if self.is_already_analyzed(pdf_path, safe_name):
+            self.logger.info("跳过已分析的文件: %s", pdf_path.name)
             return {"skipped": True, "file": pdf_path.name}
         
+        return self._analyze_paper(pdf_path, safe_name)
+    
+    def _analyze_paper(self, pdf_path: Path, safe_name: Optional[str] = None) -> Dict[str, Any]:
+        """分析单篇论文（不做已分析检查）"""
+        self.logger.info("开始分析: %s", pdf_path.name)
+        
         # 提取PDF文本
         pdf_text = self.extract_pdf_text(pdf_path)
         if not pdf_text:
             self.logger.error("PDF文本提取失败")
             return {"error": "文本提取失败", "file": pdf_path.name}
         
-        self.logger.info(f"文本提取成功，长度: {len(pdf_text)} 字符")
+        self.logger.debug("文本提取成功，长度: %d 字符", len(pdf_text))
         
         # AI分析
         analysis_result = self.analyze_paper_with_ai(pdf_text, pdf_path.name)
@@ -264,36 +753,95 @@ class AILiteratureAnalyzer:
         # 生成方法卡片
         method_card = self.generate_method_card_with_ai(analysis_result["analysis"], pdf_path.name)
         
-        # 保存结果
+        return self._complete_paper(pdf_path, analysis_result["analysis"], method_card, safe_name)
+    
+    def _analyze_paper_group(self, pdf_paths: List[Path], name_map: Dict[Path, str]) -> List[Dict[str, Any]]:
+        """分析一组论文，组内论文的AI分析合并为一次请求"""
+        if len(pdf_paths) == 1:
+            return [self._analyze_paper(pdf_paths[0], name_map[pdf_paths[0]])]
+        
+        results = {}
+        papers = []
+        for pdf_path in pdf_paths:
+            self.logger.info("开始分析: %s", pdf_path.name)
+            pdf_text = self.extract_pdf_text(pdf_path)
+            if pdf_text:
+                papers.append((pdf_path, pdf_text))
+            else:
+                self.logger.error("PDF文本提取失败: %s", pdf_path.name)
+                results[pdf_path] = {"error": "文本提取失败", "file": pdf_path.name}
+        
+        analyses = self.analyze_papers_batch([(pdf_path.name, pdf_text) for pdf_path, pdf_text in papers])
+        
+        for (pdf_path, _), analysis_result in zip(papers, analyses):
+            if "error" in analysis_result:
+                self.logger.error("AI分析失败: %s", pdf_path.name)
+                results[pdf_path] = {"error": analysis_result["error"], "file": pdf_path.name}
+                continue
+            
+            method_card = self.generate_method_card_with_ai(analysis_result["analysis"], pdf_path.name)
+            results[pdf_path] = self._complete_paper(pdf_path, analysis_result["analysis"], method_card,
+                                                     name_map[pdf_path])
+        
+        return [results[pdf_path] for pdf_path in pdf_paths]
+    
+    async def _analyze_single_paper_async(self, sem: asyncio.Semaphore, client, pdf_path: Path,
+                                          safe_name: Optional[str] = None) -> Dict[str, Any]:
+        """异步分析单篇论文，并发数由信号量限制"""
+        async with sem:
+            self.logger.info("开始分析: %s", pdf_path.name)
+            
+            # PDF解析是同步的CPU操作，放到线程中执行以免阻塞事件循环
+            pdf_text = await asyncio.to_thread(self.extract_pdf_text, pdf_path)
+            if not pdf_text:
+                self.logger.error("PDF文本提取失败")
+                return {"error": "文本提取失败", "file": pdf_path.name}
+            
+            self.logger.debug("文本提取成功，长度: %d 字符", len(pdf_text))
+            
+            # AI分析
+            self.logger.info("正在进行AI深度分析...")
+            analysis = await self._call_ai_api_async(client, self._build_analysis_messages(pdf_text, pdf_path.name))
+            if not analysis:
+                self.logger.error("AI分析失败")
+                return {"error": "AI分析失败", "file": pdf_path.name}
+            
+            # 生成方法卡片
+            self.logger.info("生成方法卡片...")
+            method_card = await self._call_ai_api_async(client, self._build_method_card_messages(analysis))
+            
+            return await asyncio.to_thread(self._complete_paper, pdf_path, analysis, method_card, safe_name)
+    
+    def _complete_paper(self, pdf_path: Path, analysis: str, method_card: str,
+                        safe_name: Optional[str] = None) -> Dict[str, Any]:
+        """汇总并保存单篇论文的分析结果"""
+        safe_name = safe_name or self._safe_filename(pdf_path.stem)
         result = {
             "file_path": str(pdf_path),
-            "analysis": analysis_result["analysis"],
+            "analysis": analysis,
             "method_card": method_card,
             "analysis_date": datetime.now().isoformat(),
             "success": True
         }
         
         # 保存分析报告
-        self._save_analysis_report(pdf_path, result)
+        self._save_analysis_report(pdf_path, result, safe_name)
         
         # 保存方法卡片
-        self._save_method_card(pdf_path, method_card)
+        self._save_method_card(pdf_path, method_card, safe_name)
         
-        self.logger.info(f"分析完成: {pdf_path.name}")
+        self.logger.info("分析完成: %s", pdf_path.name)
         return result
     
-    def _save_analysis_report(self, pdf_path: Path, result: Dict[str, Any]):
+    def _save_analysis_report(self, pdf_path: Path, result: Dict[str, Any], safe_name: Optional[str] = None):
         """保存分析报告"""
-        safe_name = self._safe_filename(pdf_path.stem)
-        output_config = self.config.get_output_config()
-        suffix = output_config['summary_suffix']
-        
-        report_path = self.summaries_dir / f"{safe_name}{suffix}.md"
+        safe_name = safe_name or self._safe_filename(pdf_path.stem)
+        report_path = self.summaries_dir / f"{safe_name}{self.summary_suffix}.md"
         
         # 构建内容
         content_parts = [f"# {pdf_path.name} - AI深度分析"]
         
-        if output_config.get('include_metadata', True):
+        if self.include_metadata:
             content_parts.extend([
                 "",
                 f"**分析时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
@@ -314,23 +862,19 @@ class AILiteratureAnalyzer:
         
         content = "\n".join(content_parts)
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        report_path.write_bytes(content.encode('utf-8'))
         
-        self.logger.info(f"分析报告已保存: {report_path.name}")
+        self.logger.info("分析报告已保存: %s", report_path.name)
     
-    def _save_method_card(self, pdf_path: Path, method_card: str):
+    def _save_method_card(self, pdf_path: Path, method_card: str, safe_name: Optional[str] = None):
         """保存方法卡片"""
-        safe_name = self._safe_filename(pdf_path.stem)
-        output_config = self.config.get_output_config()
-        suffix = output_config['method_card_suffix']
-        
-        card_path = self.method_cards_dir / f"{safe_name}{suffix}.md"
+        safe_name = safe_name or self._safe_filename(pdf_path.stem)
+        card_path = self.method_cards_dir / f"{safe_name}{self.method_card_suffix}.md"
         
         # 构建内容
         content_parts = [f"# {pdf_path.name} - 方法卡片"]
         
-        if output_config.get('include_metadata', True):
+        if self.include_metadata:
             content_parts.extend([
                 "",
                 f"**生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
@@ -350,20 +894,30 @@ class AILiteratureAnalyzer:
         
         content = "\n".join(content_parts)
         
-        with open(card_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        card_path.write_bytes(content.encode('utf-8'))
         
-        self.logger.info(f"方法卡片已保存: {card_path.name}")
+        self.logger.info("方法卡片已保存: %s", card_path.name)
     
     def _safe_filename(self, filename: str) -> str:
         """生成安全的文件名"""
-        safe_name = re.sub(r'[<>:"/\\|?*]', '', filename)
-        safe_name = re.sub(r'\s+', '_', safe_name)
+        safe_name = filename.translate(self._UNSAFE_CHARS)
+        safe_name = self._WHITESPACE_RE.sub('_', safe_name)
         return safe_name[:50]  # 限制长度
     
-    def batch_analyze_papers(self, max_papers: int = None) -> Dict[str, Any]:
-        """批量分析论文"""
-        pdf_files = list(self.input_dir.glob("*.pdf"))
+    def batch_analyze_papers(self, max_papers: int = None, use_async: bool = False,
+                             batch_mode: bool = False) -> Dict[str, Any]:
+        """
+        批量分析论文
+        
+        Args:
+            max_papers: 最多分析的论文数量
+            use_async: 是否使用asyncio + httpx异步并发调用API
+            batch_mode: 是否通过API的批处理接口离线提交（延迟高、费用低），不能与use_async同时使用
+        """
+        if use_async and batch_mode:
+            raise ValueError("use_async与batch_mode不能同时使用")
+        
+        pdf_files = list_pdf_files(self.input_dir)
         
         if max_papers:
             pdf_files = pdf_files[:max_papers]
@@ -379,26 +933,68 @@ class AILiteratureAnalyzer:
             "start_time": datetime.now().isoformat()
         }
         
-        for i, pdf_path in enumerate(pdf_files, 1):
-            self.logger.info(f"--- 处理 {i}/{len(pdf_files)} ---")
+        # 安全文件名只计算一次，后续检查和保存均复用
+        name_map = {pdf_path: self._safe_filename(pdf_path.stem) for pdf_path in pdf_files}
+        
+        # 预先过滤已分析的文件，避免逐个检查
+        pdf_files, analyzed_files = self._partition_analyzed(pdf_files, name_map)
+        for pdf_path in analyzed_files:
+            self._record_result(results, {"skipped": True, "file": pdf_path.name})
+        if analyzed_files:
+            self.logger.info(f"跳过已分析的文件 {len(analyzed_files)} 篇")
+        
+        if batch_mode:
+            from .batch_submitter import BatchSubmitter
             
-            try:
-                result = self.analyze_single_paper(pdf_path)
-                if result.get("success"):
-                    results["successful"] += 1
-                elif result.get("skipped"):
-                    results["skipped"] += 1
-                else:
-                    results["failed"] += 1
-                results["results"].append(result)
-                
-            except Exception as e:
-                self.logger.error(f"处理 {pdf_path.name} 时出错: {e}")
-                results["failed"] += 1
-                results["results"].append({
-                    "error": str(e),
-                    "file": pdf_path.name
-                })
+            for result in BatchSubmitter(self).analyze_papers(pdf_files, name_map):
+                self._record_result(results, result)
+        elif use_async:
+            self.logger.info(f"异步并发数: {self.async_concurrency}")
+            paper_results = asyncio.run(self._batch_async(pdf_files, name_map))
+            
+            for pdf_path, result in zip(pdf_files, paper_results):
+                if isinstance(result, Exception):
+                    self.logger.error("处理 %s 时出错: %s", pdf_path.name, result)
+                    result = {"error": str(result), "file": pdf_path.name}
+                self._record_result(results, result)
+        else:
+            # 论文之间相互独立，使用线程池/进程池并行处理；
+            # batch_llm_size > 1 时每组论文的AI分析合并为一次请求
+            executor_class = ProcessPoolExecutor if self.parallel_backend == 'process' else ThreadPoolExecutor
+            self.logger.info(f"并行工作数: {self.parallel_workers} ({self.parallel_backend})")
+            
+            groups = [pdf_files[i:i + self.batch_llm_size]
+                      for i in range(0, len(pdf_files), self.batch_llm_size)]
+            
+            with executor_class(max_workers=self.parallel_workers) as executor:
+                try:
+                    # 每组只传递本组的文件名映射，减少进程池的序列化开销
+                    futures = {executor.submit(self._analyze_paper_group, group,
+                                               {pdf_path: name_map[pdf_path] for pdf_path in group}): group
+                               for group in groups}
+                    
+                    # 结果只在当前线程中汇总，无需额外加锁
+                    done = 0
+                    for future in as_completed(futures):
+                        group = futures[future]
+                        done += len(group)
+                        # 拼接文件名的开销只在INFO级别开启时产生
+                        if self.logger.isEnabledFor(logging.INFO):
+                            self.logger.info("--- 完成 %d/%d: %s ---", done, len(pdf_files),
+                                             ', '.join(p.name for p in group))
+                        
+                        try:
+                            group_results = future.result()
+                        except Exception as e:
+                            self.logger.error("处理 %s 时出错: %s", ', '.join(p.name for p in group), e)
+                            group_results = [{"error": str(e), "file": pdf_path.name} for pdf_path in group]
+                        
+                        for result in group_results:
+                            self._record_result(results, result)
+                except BaseException:
+                    # Ctrl-C等中断时取消尚未开始的论文，避免退出前继续处理整个队列
+                    self._abort_executor(executor)
+                    raise
         
         results["end_time"] = datetime.now().isoformat()
         
@@ -412,18 +1008,62 @@ class AILiteratureAnalyzer:
         
         return results
     
+    @staticmethod
+    def _abort_executor(executor):
+        """取消执行器中尚未开始的任务；进程池还需结束子进程，因为已分派到子进程队列的任务无法取消"""
+        if not isinstance(executor, ProcessPoolExecutor):
+            executor.shutdown(wait=False, cancel_futures=True)
+            return
+        
+        terminate_workers = getattr(executor, 'terminate_workers', None)  # Python 3.14+
+        if terminate_workers is not None:
+            terminate_workers()
+            return
+        
+        # shutdown()会清空进程表，需先取出子进程
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+    
+    async def _batch_async(self, pdf_files: List[Path], name_map: Dict[Path, str]) -> List[Any]:
+        """使用httpx.AsyncClient并发分析所有论文"""
+        import httpx
+        
+        sem = asyncio.Semaphore(self.async_concurrency)
+        limits = httpx.Limits(max_connections=self.async_concurrency)
+        
+        async with httpx.AsyncClient(timeout=self.timeout, limits=limits, headers=self._headers) as client:
+            return await asyncio.gather(
+                *[self._analyze_single_paper_async(sem, client, pdf_path, name_map[pdf_path])
+                  for pdf_path in pdf_files],
+                return_exceptions=True
+            )
+    
+    def _record_result(self, results: Dict[str, Any], result: Dict[str, Any]):
+        """将单篇论文的结果计入批量统计"""
+        if result.get("success"):
+            results["successful"] += 1
+        elif result.get("skipped"):
+            results["skipped"] += 1
+        else:
+            results["failed"] += 1
+        results["results"].append(result)
+    
     def _save_batch_report(self, results: Dict[str, Any]):
         """保存批量分析报告"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        now_str = now.strftime('%Y-%m-%d %H:%M:%S')
         report_path = self.batch_reports_dir / f"ai_batch_analysis_{timestamp}.md"
         
         success_rate = (results["successful"] / results["total_papers"] * 100) if results["total_papers"] > 0 else 0
         
-        content = f"""# AI驱动批量文献分析报告
+        parts: List[str] = [f"""# AI驱动批量文献分析报告
 
 ## 📊 分析统计
 
-- **分析时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+- **分析时间**: {now_str}
 - **使用模型**: {self.model}
 - **总论文数**: {results["total_papers"]}
 - **成功分析**: {results["successful"]} 篇
@@ -433,56 +1073,59 @@ class AILiteratureAnalyzer:
 
 ## 📋 分析详情
 
-"""
+"""]
         
         # 成功的分析
         successful_papers = [r for r in results["results"] if r.get("success")]
         if successful_papers:
-            content += "### ✅ 成功分析的论文\n\n"
+            parts.append("### ✅ 成功分析的论文\n\n")
             for i, result in enumerate(successful_papers, 1):
                 filename = Path(result["file_path"]).name
-                content += f"{i}. **{filename}**\n"
-            content += "\n"
+                parts.append(f"{i}. **{filename}**\n")
+            parts.append("\n")
         
         # 跳过的分析
         skipped_papers = [r for r in results["results"] if r.get("skipped")]
         if skipped_papers:
-            content += "### ⏭️ 跳过的论文\n\n"
+            parts.append("### ⏭️ 跳过的论文\n\n")
             for i, result in enumerate(skipped_papers, 1):
                 filename = result.get("file", "未知文件")
-                content += f"{i}. **{filename}** - 已存在分析结果\n"
-            content += "\n"
+                parts.append(f"{i}. **{filename}** - 已存在分析结果\n")
+            parts.append("\n")
         
         # 失败的分析
         failed_papers = [r for r in results["results"] if not r.get("success") and not r.get("skipped")]
         if failed_papers:
-            content += "### ❌ 分析失败的论文\n\n"
+            parts.append("### ❌ 分析失败的论文\n\n")
             for i, result in enumerate(failed_papers, 1):
                 filename = result.get("file", "未知文件")
                 error = result.get("error", "未知错误")
-                content += f"{i}. **{filename}** - {error}\n"
-            content += "\n"
+                parts.append(f"{i}. **{filename}** - {error}\n")
+            parts.append("\n")
         
-        content += f"""## 🎯 系统配置
+        text_limit = f"{self.max_input_tokens} Token" if self.max_input_tokens > 0 else f"{self.max_text_length} 字符"
+        
+        parts.append(f"""## 🎯 系统配置
 
 - **AI模型**: {self.model}
-- **最大文本长度**: {self.max_text_length} 字符
+- **最大文本长度**: {text_limit}
 - **提取页数**: {self.extract_pages if self.extract_pages > 0 else '全部'}
 - **跳过已分析**: {'是' if self.skip_analyzed else '否'}
 
 ## 📚 生成文件
 
-- **分析报告**: `{self.summaries_dir.name}/*{self.config.get_output_config()['summary_suffix']}.md`
-- **方法卡片**: `{self.method_cards_dir.name}/*{self.config.get_output_config()['method_card_suffix']}.md`
+- **分析报告**: `{self.summaries_dir.name}/*{self.summary_suffix}.md`
+- **方法卡片**: `{self.method_cards_dir.name}/*{self.method_card_suffix}.md`
 - **批量报告**: 本文件
 
 ---
 
-*报告生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
+*报告生成时间: {now_str}*
 *AI驱动文献分析系统*
-"""
+""")
+        
+        content = "".join(parts)
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        report_path.write_bytes(content.encode('utf-8'))
         
         self.logger.info(f"批量分析报告已保存: {report_path.name}")
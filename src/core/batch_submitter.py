@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+批处理任务提交器
+通过OpenAI兼容API的批处理接口(/batches)离线提交分析任务
+
+Copyright (c) 2024 Yudong Fang (yudongfang55@gmail.com)
+Licensed under the MIT License. See LICENSE file for details.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from requests import RequestException
+
+
+class BatchSubmitter:
+    """批处理任务提交器，适合对延迟不敏感的大批量分析（通常费用更低）"""
+    
+    # 批处理任务的终止状态
+    FINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+    
+    def __init__(self, analyzer):
+        """
+        初始化批处理任务提交器
+        
+        Args:
+            analyzer: AILiteratureAnalyzer实例，复用其配置、会话和缓存
+        """
+        self.analyzer = analyzer
+        self.logger = analyzer.logger
+        self.session = analyzer._session
+        self.api_base = analyzer.api_base
+        
+        api_config = analyzer.config.get_api_config()
+        self.poll_interval = api_config.get('batch_poll_interval', 60)
+        self.completion_window = api_config.get('batch_completion_window', '24h')
+        
+        self.work_dir = analyzer.cache_dir / "batches"
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+    
+    def analyze_papers(self, pdf_files: List[Path],
+                       name_map: Optional[Dict[Path, str]] = None) -> List[Dict[str, Any]]:
+        """
+        以批处理任务分析论文：先提交全部分析请求，再提交全部方法卡片请求
+        
+        Args:
+            pdf_files: 待分析的PDF文件列表
+            name_map: PDF路径 -> 安全文件名，为空时逐个生成
+        
+        Returns:
+            与pdf_files一一对应的分析结果
+        """
+        if name_map is None:
+            name_map = {pdf_path: self.analyzer._safe_filename(pdf_path.stem) for pdf_path in pdf_files}
+        
+        results = {}
+        papers = {}
+        
+        for i, pdf_path in enumerate(pdf_files):
+            pdf_text = self.analyzer.extract_pdf_text(pdf_path)
+            if not pdf_text:
+                self.logger.error("PDF文本提取失败: %s", pdf_path.name)
+                results[pdf_path] = {"error": "文本提取失败", "file": pdf_path.name}
+                continue
+            
+            custom_id = f"{i:05d}_{name_map[pdf_path]}"
+            papers[custom_id] = (pdf_path, pdf_text)
+        
+        # 第一轮：论文分析
+        analyses = self._run_job("analysis", {
+            custom_id: self.analyzer._build_analysis_messages(pdf_text, pdf_path.name)
+            for custom_id, (pdf_path, pdf_text) in papers.items()
+        })
+        
+        # 第二轮：基于分析结果生成方法卡片
+        method_cards = self._run_job("method_card", {
+            custom_id: self.analyzer._build_method_card_messages(analysis)
+            for custom_id, analysis in analyses.items()
+        })
+        
+        for custom_id, (pdf_path, _) in papers.items():
+            analysis = analyses.get(custom_id)
+            if not analysis:
+                results[pdf_path] = {"error": "AI分析失败", "file": pdf_path.name}
+                continue
+            
+            method_card = method_cards.get(custom_id, "")
+            results[pdf_path] = self.analyzer._complete_paper(pdf_path, analysis, method_card, name_map[pdf_path])
+        
+        return [results[pdf_path] for pdf_path in pdf_files]
+    
+    def _run_job(self, name: str, requests: Dict[str, List[Dict[str, str]]]) -> Dict[str, str]:
+        """
+        提交一个批处理任务并等待结果，已缓存的请求不会重复提交
+        
+        Args:
+            name: 任务名称，用于生成输入文件名
+            requests: custom_id -> 对话消息
+        
+        Returns:
+            custom_id -> 模型输出
+        """
+        outputs = {}
+        pending = {}
+        cache_keys = {}
+        
+        for custom_id, messages in requests.items():
+            cached, key = self.analyzer._lookup_llm_cache(messages)
+            if cached is not None:
+                outputs[custom_id] = cached
+            else:
+                pending[custom_id] = messages
+                cache_keys[custom_id] = key
+        
+        if not pending:
+            return outputs
+        
+        self.logger.info(f"提交批处理任务 [{name}]，共 {len(pending)} 个请求")
+        
+        input_path = self.work_dir / f"batch_in_{name}.jsonl"
+        self._write_input_file(input_path, pending)
+        
+        # 任何一步失败都只放弃本轮任务，未得到结果的论文按分析失败记录
+        try:
+            file_id = self._upload_file(input_path)
+            batch = self._wait_for_batch(self._create_batch(file_id))
+            
+            if batch.get('status') != 'completed' or not batch.get('output_file_id'):
+                self.logger.error(f"批处理任务 [{name}] 未成功完成: {batch.get('status')}")
+                return outputs
+            
+            results = self._download_results(batch['output_file_id'])
+        except (RequestException, ValueError, KeyError) as e:
+            self.logger.error(f"批处理任务 [{name}] 出错: {e}")
+            return outputs
+        
+        for custom_id, content in results.items():
+            if custom_id in pending:
+                outputs[custom_id] = content
+                self.analyzer._store_llm_cache(cache_keys[custom_id], content)
+        
+        self.logger.info(f"批处理任务 [{name}] 完成，成功 {len(outputs)}/{len(requests)}")
+        return outputs
+    
+    def _write_input_file(self, path: Path, requests: Dict[str, List[Dict[str, str]]]):
+        """写入JSONL格式的批处理输入文件"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for custom_id, messages in requests.items():
+                line = {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self.analyzer._build_request_data(messages)
+                }
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+    
+    def _upload_file(self, path: Path) -> str:
+        """上传批处理输入文件，返回文件ID"""
+        with open(path, 'rb') as f:
+            # 会话默认的JSON Content-Type需去掉，由requests生成multipart头
+            response = self.session.post(
+                f"{self.api_base}/files",
+                headers={"Content-Type": None},
+                data={"purpose": "batch"},
+                files={"file": (path.name, f, "application/jsonl")},
+                timeout=self.analyzer.timeout
+            )
+        response.raise_for_status()
+        return response.json()["id"]
+    
+    def _create_batch(self, file_id: str) -> str:
+        """创建批处理任务，返回任务ID"""
+        response = self.session.post(
+            f"{self.api_base}/batches",
+            json={
+                "input_file_id": file_id,
+                "endpoint": "/v1/chat/completions",
+                "completion_window": self.completion_window
+            },
+            timeout=self.analyzer.timeout
+        )
+        response.raise_for_status()
+        batch_id = response.json()["id"]
+        self.logger.info(f"批处理任务已创建: {batch_id}")
+        return batch_id
+    
+    def _wait_for_batch(self, batch_id: str) -> Dict[str, Any]:
+        """轮询批处理任务状态直到结束；偶发的查询失败不会中断等待，连续失败超过max_retries次才放弃"""
+        failures = 0
+        while True:
+            try:
+                response = self.session.get(f"{self.api_base}/batches/{batch_id}", timeout=self.analyzer.timeout)
+                response.raise_for_status()
+                batch = response.json()
+            except (RequestException, ValueError) as e:
+                failures += 1
+                if failures >= self.analyzer.max_retries:
+                    self.logger.error(f"批处理任务 {batch_id} 状态查询连续失败 {failures} 次，停止等待")
+                    raise
+                self.logger.warning(f"批处理任务 {batch_id} 状态查询失败，稍后重试: {e}")
+                time.sleep(self.poll_interval)
+                continue
+            
+            failures = 0
+            
+            status = batch.get('status')
+            if status in self.FINAL_STATUSES:
+                return batch
+            
+            counts = batch.get('request_counts') or {}
+            self.logger.info(f"批处理任务 {batch_id} 状态: {status} "
+                             f"({counts.get('completed', 0)}/{counts.get('total', '?')})")
+            time.sleep(self.poll_interval)
+    
+    def _download_results(self, file_id: str) -> Dict[str, str]:
+        """下载批处理结果文件，返回 custom_id -> 模型输出"""
+        response = self.session.get(f"{self.api_base}/files/{file_id}/content", timeout=self.analyzer.timeout)
+        response.raise_for_status()
+        
+        outputs = {}
+        for line in response.text.splitlines():
+            if not line.strip():
+                continue
+            
+            try:
+                item = json.loads(line)
+                result = item.get("response") or {}
+                if result.get("status_code") != 200:
+                    self.logger.error("批处理请求失败: %s - %s", item.get('custom_id'), item.get('error'))
+                    continue
+                
+                outputs[item["custom_id"]] = result["body"]["choices"][0]["message"]["content"]
+            except (ValueError, KeyError, IndexError, TypeError, AttributeError) as e:
+                self.logger.error("无法解析批处理结果: %s - %s", line[:200], e)
+        
+        return outputs
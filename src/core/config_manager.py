@@ -10,8 +10,116 @@ Licensed under the MIT License. See LICENSE file for details.
 
 import yaml
 import os
+import copy
+import functools
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
+
+# 优先使用libyaml提供的C实现解析器，不可用时回退到纯Python实现
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# 进程内共享的配置解析结果: 绝对路径 -> ((修改时间, 文件大小), 配置)
+# 文件未变化时，多次创建ConfigManager不会重复解析YAML（缓存保留原始副本，各实例获得独立拷贝）
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# 配置文件必须包含的部分
+_REQUIRED_SECTIONS = frozenset({'api', 'paths', 'processing', 'output', 'prompts'})
+
+# 配置文件的结构约束（安装fastjsonschema时启用）
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "required": sorted(_REQUIRED_SECTIONS),
+    "properties": {
+        "api": {
+            "type": "object",
+            "required": ["api_key", "base_url", "model", "timeout", "max_retries",
+                         "retry_delay", "temperature", "max_tokens"],
+            "properties": {
+                "api_key": {"type": ["string", "null"]},
+                "base_url": {"type": "string"},
+                "model": {"type": "string"},
+                "timeout": {"type": "number", "exclusiveMinimum": 0},
+                "max_retries": {"type": "integer", "minimum": 1},
+                "retry_delay": {"type": "number", "minimum": 0},
+                "temperature": {"type": "number", "minimum": 0},
+                "max_tokens": {"type": "integer", "minimum": 1},
+                "batch_completion_window": {"type": "string"},
+                "batch_poll_interval": {"type": "number", "exclusiveMinimum": 0}
+            }
+        },
+        "paths": {
+            "type": "object",
+            "required": ["input_dir", "output_dir", "summaries_dir", "method_cards_dir", "batch_reports_dir"],
+            "additionalProperties": {"type": "string"}
+        },
+        "processing": {
+            "type": "object",
+            "required": ["max_text_length", "extract_pages", "skip_analyzed"],
+            "properties": {
+                "max_text_length": {"type": "integer", "minimum": 1},
+                "max_input_tokens": {"type": "integer", "minimum": 0},
+                "extract_pages": {"type": "integer", "minimum": 0},
+                "page_workers": {"type": "integer", "minimum": 1},
+                "batch_size": {"type": "integer", "minimum": 0},
+                "parallel_workers": {"type": "integer", "minimum": 1},
+                "parallel_backend": {"enum": ["thread", "process"]},
+                "async_concurrency": {"type": "integer", "minimum": 1},
+                "batch_llm_size": {"type": "integer", "minimum": 1},
+                "supported_formats": {"type": "array", "items": {"type": "string"}},
+                "skip_analyzed": {"type": "boolean"},
+                "enable_cache": {"type": "boolean"}
+            }
+        },
+        "output": {
+            "type": "object",
+            "required": ["summary_suffix", "method_card_suffix"],
+            "properties": {
+                "summary_suffix": {"type": "string"},
+                "method_card_suffix": {"type": "string"},
+                "include_metadata": {"type": "boolean"}
+            }
+        },
+        "prompts": {
+            "type": "object",
+            "properties": {
+                "analysis_template": {"type": "string"},
+                "method_card_template": {"type": "string"}
+            }
+        },
+        "logging": {"type": ["object", "null"]}
+    }
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_config_validator():
+    """编译配置校验函数（只编译一次），fastjsonschema未安装时返回None"""
+    try:
+        import fastjsonschema
+    except ImportError:
+        return None
+    return fastjsonschema.compile(_CONFIG_SCHEMA)
+
+
+def _freeze(value: Any) -> Any:
+    """递归转换为只读结构：dict -> MappingProxyType，list -> tuple"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """_freeze的逆操作，还原为可pickle的dict/list"""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
 
 class ConfigManager:
     """配置管理器"""
@@ -34,24 +142,77 @@ class ConfigManager:
         self.config_path = config_path
         self.config = self._load_config()
         self._validate_config()
+        
+        # 校验通过后整体转为只读，get()与各get_*_config()读取的始终是同一份配置
+        self._freeze_config()
+        
+        # 路径配置加载后不再变化，预先转换为绝对路径
+        self._paths_abs = self._resolve_paths()
+        
+        # 已读取的提示词模板: 模板类型 -> 内容
+        self._template_cache: Dict[str, str] = {}
+    
+    def _freeze_config(self):
+        """将配置转换为只读结构，并建立扁平索引"""
+        self.config = _freeze(self.config)
+        
+        # 点分隔键 -> 值 的扁平索引，get()只需一次字典查找（配置只读，索引不会过期）
+        self._flat = self._flatten(self.config)
+    
+    def __getstate__(self):
+        """序列化时还原为普通字典（MappingProxyType无法pickle，进程池需要序列化实例）"""
+        state = self.__dict__.copy()
+        state['config'] = _thaw(self.config)
+        del state['_flat']
+        return state
+    
+    def __setstate__(self, state):
+        """反序列化后重新转为只读结构"""
+        self.__dict__.update(state)
+        self._freeze_config()
     
     def _load_config(self) -> Dict[str, Any]:
-        """加载配置文件"""
+        """加载配置文件，文件未修改时复用已解析的结果"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            cache_key = str(Path(self.config_path).resolve())
+            st = os.stat(cache_key)
+            stamp = (st.st_mtime_ns, st.st_size)
+            
+            with _CONFIG_CACHE_LOCK:
+                cached = _CONFIG_CACHE.get(cache_key)
+                if cached is not None and cached[0] == stamp:
+                    return copy.deepcopy(cached[1])
+                
+                # 以字节方式读取，由YAML解析器自行解码UTF-8
+                with open(cache_key, 'rb') as f:
+                    config = yaml.load(f, Loader=_YamlLoader)
+                _CONFIG_CACHE[cache_key] = (stamp, copy.deepcopy(config))
             return config
         except FileNotFoundError:
             raise FileNotFoundError(f"配置文件未找到: {self.config_path}")
         except yaml.YAMLError as e:
             raise ValueError(f"配置文件格式错误: {e}")
     
+    @classmethod
+    def invalidate_cache(cls):
+        """清空进程内的配置缓存，下次创建实例时重新解析配置文件"""
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE.clear()
+    
     def _validate_config(self):
         """验证配置的完整性"""
-        required_sections = ['api', 'paths', 'processing', 'output', 'prompts']
-        for section in required_sections:
-            if section not in self.config:
-                raise ValueError(f"配置文件缺少必要部分: {section}")
+        missing = _REQUIRED_SECTIONS - self.config.keys()
+        if missing:
+            raise ValueError(f"配置文件缺少必要部分: {', '.join(sorted(missing))}")
+        
+        # 校验各配置项的类型和取值范围
+        validator = _get_config_validator()
+        if validator is not None:
+            from fastjsonschema import JsonSchemaException
+            try:
+                validator(self.config)
+            except JsonSchemaException as e:
+                raise ValueError(f"配置文件格式错误: {e.message}")
         
         # 检查API密钥
         api_key = self.config['api'].get('api_key')
@@ -69,46 +230,51 @@ class ConfigManager:
         Returns:
             配置值
         """
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
     
-    def get_api_config(self) -> Dict[str, Any]:
-        """获取API配置"""
+    @staticmethod
+    def _flatten(config: Mapping[str, Any], prefix: str = '') -> Dict[str, Any]:
+        """将嵌套配置展开为点分隔键的字典，中间层级的字典也一并收录"""
+        flat = {}
+        for k, v in config.items():
+            key = f"{prefix}{k}"
+            flat[key] = v
+            if isinstance(v, Mapping):
+                flat.update(ConfigManager._flatten(v, f"{key}."))
+        return flat
+    
+    def get_api_config(self) -> Mapping[str, Any]:
+        """获取API配置（只读）"""
         return self.config['api']
     
     def get_paths_config(self) -> Dict[str, str]:
         """获取路径配置，并转换为绝对路径"""
-        paths = self.config['paths'].copy()
-        
-        # 转换为绝对路径
-        for key, path in paths.items():
-            if not os.path.isabs(path):
-                paths[key] = str(self.project_root / path)
+        return self._paths_abs.copy()
+    
+    def _resolve_paths(self) -> Dict[str, str]:
+        """将路径配置转换为绝对路径"""
+        root = self.project_root
         
+        # 缓存目录（旧配置文件中可能没有该项）
+        paths = {key: path if os.path.isabs(path) else str(root / path)
+                 for key, path in self.config['paths'].items()}
+        paths.setdefault('cache_dir', str(root / 'data/cache'))
         return paths
     
-    def get_processing_config(self) -> Dict[str, Any]:
-        """获取处理配置"""
+    def get_processing_config(self) -> Mapping[str, Any]:
+        """获取处理配置（只读）"""
         return self.config['processing']
     
-    def get_output_config(self) -> Dict[str, Any]:
-        """获取输出配置"""
+    def get_output_config(self) -> Mapping[str, Any]:
+        """获取输出配置（只读）"""
         return self.config['output']
     
-    def get_prompts_config(self) -> Dict[str, Any]:
-        """获取提示词配置"""
+    def get_prompts_config(self) -> Mapping[str, Any]:
+        """获取提示词配置（只读）"""
         return self.config['prompts']
     
-    def get_logging_config(self) -> Dict[str, Any]:
-        """获取日志配置"""
+    def get_logging_config(self) -> Mapping[str, Any]:
+        """获取日志配置（只读）"""
         return self.config.get('logging', {})
     
     def load_prompt_template(self, template_type: str) -> str:
@@ -121,6 +287,10 @@ class ConfigManager:
         Returns:
             模板内容
         """
+        cached = self._template_cache.get(template_type)
+        if cached is not None:
+            return cached
+        
         prompts_config = self.get_prompts_config()
         
         if template_type == 'analysis':
@@ -131,14 +301,17 @@ class ConfigManager:
             raise ValueError(f"未知的模板类型: {template_type}")
         
         # 转换为绝对路径
-        if not os.path.isabs(template_file):
+        template_file = Path(template_file)
+        if not template_file.is_absolute():
             template_file = self.project_root / template_file
         
         try:
-            with open(template_file, 'r', encoding='utf-8') as f:
-                return f.read()
+            template = template_file.read_text(encoding='utf-8')
         except FileNotFoundError:
             raise FileNotFoundError(f"提示词模板文件未找到: {template_file}")
+        
+        self._template_cache[template_type] = template
+        return template
     
     def create_directories(self):
         """创建必要的目录"""
@@ -149,7 +322,8 @@ class ConfigManager:
             paths['output_dir'],
             paths['summaries_dir'],
             paths['method_cards_dir'],
-            paths['batch_reports_dir']
+            paths['batch_reports_dir'],
+            paths['cache_dir']
         ]
         
         for directory in directories:
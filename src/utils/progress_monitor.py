@@ -4,9 +4,18 @@
 进度监控工具
 """
 
+import heapq
+import os
+import sys
+import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Set, Tuple
+
+
+def _is_pdf_name(name: str) -> bool:
+    """判断文件名是否为PDF（不区分大小写，与core.analyzer.list_pdf_files的规则一致）"""
+    return name.lower().endswith(".pdf")
 
 
 class ProgressMonitor:
@@ -25,15 +34,38 @@ class ProgressMonitor:
         self.output_dir = Path(output_dir)
         self.summaries_dir = self.output_dir / "summaries"
         self.check_interval = check_interval
+        
+        # 监控循环的停止信号和唤醒信号（文件变化或stop()时触发）
+        # 停止信号只在此处初始化，监控开始前调用的stop()同样有效
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        
+        # watchdog监听时由事件增量维护的文件状态；为None表示使用轮询扫描
+        self._lock = threading.Lock()
+        self._pdf_names: Optional[Set[str]] = None
+        self._analysis_mtimes: Optional[Dict[str, float]] = None
+        
+        # 轮询时缓存PDF总数，仅在输入目录修改时间变化时重新统计
+        self._input_dir_mtime: Optional[int] = None
+        self._total_cached = 0
     
     def get_progress(self) -> dict:
         """获取当前进度"""
-        # 统计PDF文件数量
-        pdf_files = list(self.input_dir.glob("*.pdf"))
-        total_papers = len(pdf_files)
+        with self._lock:
+            watching = self._pdf_names is not None
+            if watching:
+                total_papers = len(self._pdf_names)
+                ai_analysis_files = [(mtime, name) for name, mtime in self._analysis_mtimes.items()]
+        
+        if not watching:
+            # 统计PDF文件数量
+            total_papers = self._count_pdf_files()
+            
+            # 统计已分析的文件数量，同时记录修改时间用于查找最新文件
+            ai_analysis_files = [(entry.stat().st_mtime, entry.name)
+                                 for entry in self._scandir(self.summaries_dir)
+                                 if entry.name.endswith("_ai_analysis.md")]
         
-        # 统计已分析的文件数量
-        ai_analysis_files = list(self.summaries_dir.glob("*_ai_analysis.md"))
         analyzed_count = len(ai_analysis_files)
         
         progress_pct = (analyzed_count / total_papers * 100) if total_papers > 0 else 0
@@ -46,29 +78,159 @@ class ProgressMonitor:
             "recent_files": self._get_recent_files(ai_analysis_files)
         }
     
-    def _get_recent_files(self, files: list, limit: int = 3) -> list:
+    def _count_pdf_files(self) -> int:
+        """统计输入目录中的PDF数量，目录未变化时直接使用上次的结果"""
+        try:
+            mtime = os.stat(self.input_dir).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+        
+        if mtime != self._input_dir_mtime:
+            self._total_cached = sum(1 for entry in self._scandir(self.input_dir)
+                                     if _is_pdf_name(entry.name) and entry.is_file())
+            self._input_dir_mtime = mtime
+        return self._total_cached
+    
+    @staticmethod
+    def _scandir(directory: Path) -> List[os.DirEntry]:
+        """一次列出目录内容，目录不存在时返回空列表"""
+        try:
+            with os.scandir(directory) as it:
+                return list(it)
+        except FileNotFoundError:
+            return []
+    
+    def _start_observer(self):
+        """
+        启动watchdog文件系统监听，由事件增量更新文件状态
+        
+        Returns:
+            Observer实例；watchdog未安装或目录无法监听时返回None（回退为轮询）
+        """
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import PatternMatchingEventHandler
+        except ImportError:
+            return None
+        
+        # 目录不存在时watchdog会在start()中失败并遗留inotify句柄，直接回退为轮询
+        if not (self.input_dir.is_dir() and self.summaries_dir.is_dir()):
+            return None
+        
+        monitor = self
+        
+        class _Handler(PatternMatchingEventHandler):
+            def on_any_event(self, event):
+                monitor._on_fs_event(event)
+        
+        handler = _Handler(patterns=["*.pdf", "*_ai_analysis.md"], ignore_directories=True, case_sensitive=False)
+        observer = Observer()
+        try:
+            observer.schedule(handler, str(self.input_dir), recursive=False)
+            observer.schedule(handler, str(self.summaries_dir), recursive=False)
+            observer.start()
+        except OSError:
+            # start()可能已启动部分目录的监听线程，需全部停止，避免线程和inotify句柄泄漏
+            observer.unschedule_all()
+            observer.stop()
+            if observer.is_alive():
+                observer.join()
+            return None
+        
+        # 先开始监听再做一次全量扫描，避免遗漏扫描期间出现的文件
+        pdf_names = {entry.name for entry in self._scandir(self.input_dir)
+                     if _is_pdf_name(entry.name) and entry.is_file()}
+        analysis_mtimes = {entry.name: entry.stat().st_mtime
+                           for entry in self._scandir(self.summaries_dir)
+                           if entry.name.endswith("_ai_analysis.md")}
+        with self._lock:
+            self._pdf_names = pdf_names
+            self._analysis_mtimes = analysis_mtimes
+        
+        return observer
+    
+    def _stop_observer(self, observer):
+        """停止文件系统监听并恢复为轮询扫描"""
+        observer.stop()
+        observer.join()
+        with self._lock:
+            self._pdf_names = None
+            self._analysis_mtimes = None
+    
+    def _on_fs_event(self, event):
+        """处理watchdog事件（在监听线程中调用）"""
+        if event.event_type == 'moved':
+            self._update_file(event.src_path, exists=False)
+            self._update_file(event.dest_path, exists=True)
+        elif event.event_type in ('created', 'modified'):
+            self._update_file(event.src_path, exists=True)
+        elif event.event_type == 'deleted':
+            self._update_file(event.src_path, exists=False)
+        else:
+            return
+        
+        self._wake.set()
+    
+    def _update_file(self, path: str, exists: bool):
+        """根据单个文件的变化更新计数状态"""
+        directory, name = os.path.split(path)
+        
+        if _is_pdf_name(name) and directory == str(self.input_dir):
+            with self._lock:
+                if self._pdf_names is None:
+                    return
+                if exists:
+                    self._pdf_names.add(name)
+                else:
+                    self._pdf_names.discard(name)
+        
+        elif name.endswith("_ai_analysis.md") and directory == str(self.summaries_dir):
+            mtime = None
+            if exists:
+                try:
+                    mtime = os.stat(path).st_mtime
+                except FileNotFoundError:
+                    pass
+            
+            with self._lock:
+                if self._analysis_mtimes is None:
+                    return
+                if mtime is not None:
+                    self._analysis_mtimes[name] = mtime
+                else:
+                    self._analysis_mtimes.pop(name, None)
+    
+    def _get_recent_files(self, files: List[Tuple[float, str]], limit: int = 3) -> list:
         """获取最近的文件"""
         if not files:
             return []
         
-        # 按修改时间排序
-        recent_files = sorted(files, key=lambda x: x.stat().st_mtime, reverse=True)
-        return [f.name for f in recent_files[:limit]]
+        # 只需前几个，用堆选取修改时间最新的文件，无需整体排序
+        return [name for _, name in heapq.nlargest(limit, files)]
     
     def print_progress(self):
         """打印当前进度"""
         progress = self.get_progress()
         
-        print(f"📊 分析进度监控")
-        print(f"📚 总论文数: {progress['total_papers']}")
-        print(f"✅ 已分析: {progress['analyzed_count']}")
-        print(f"🔄 进度: {progress['analyzed_count']}/{progress['total_papers']} ({progress['progress_percentage']:.1f}%)")
-        print(f"⏳ 剩余: {progress['remaining']}")
+        lines = [
+            "📊 分析进度监控",
+            f"📚 总论文数: {progress['total_papers']}",
+            f"✅ 已分析: {progress['analyzed_count']}",
+            f"🔄 进度: {progress['analyzed_count']}/{progress['total_papers']} ({progress['progress_percentage']:.1f}%)",
+            f"⏳ 剩余: {progress['remaining']}"
+        ]
         
         if progress['recent_files']:
-            print(f"\n📝 最新分析的文件:")
-            for file in progress['recent_files']:
-                print(f"  - {file}")
+            lines.append("\n📝 最新分析的文件:")
+            lines.extend(f"  - {file}" for file in progress['recent_files'])
+        
+        self._write_lines(lines)
+    
+    @staticmethod
+    def _write_lines(lines: List[str]):
+        """将多行内容拼接后一次写出"""
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     def monitor_continuously(self, max_duration: Optional[int] = None):
         """
@@ -77,9 +239,23 @@ class ProgressMonitor:
         Args:
             max_duration: 最大监控时长(秒)，None表示无限制
         """
-        print(f"📊 开始监控AI分析进度")
-        print("=" * 50)
+        self._write_lines(["📊 开始监控AI分析进度", "=" * 50])
         
+        # 安装了watchdog时由文件系统事件驱动，否则按间隔轮询
+        observer = self._start_observer()
+        try:
+            self._monitor_loop(max_duration)
+        finally:
+            if observer is not None:
+                self._stop_observer(observer)
+    
+    def stop(self):
+        """停止持续监控（可在其他线程中调用），监控循环会立即退出；在监控开始前调用时，监控开始后会立即结束"""
+        self._stop.set()
+        self._wake.set()
+    
+    def _monitor_loop(self, max_duration: Optional[int]):
+        """监控主循环"""
         start_time = time.time()
         last_count = 0
         
@@ -90,20 +266,23 @@ class ProgressMonitor:
             
             # 检查是否有进度更新
             if current_count != last_count:
-                print(f"🔄 进度更新: {current_count}/{total_papers} ({progress['progress_percentage']:.1f}%)")
+                lines = [f"🔄 进度更新: {current_count}/{total_papers} ({progress['progress_percentage']:.1f}%)"]
                 
                 if current_count > last_count:
                     # 显示新完成的文件
                     new_files_count = current_count - last_count
                     recent_files = progress['recent_files'][:new_files_count]
-                    for file in recent_files:
-                        print(f"  ✅ 新完成: {file}")
+                    lines.extend(f"  ✅ 新完成: {file}" for file in recent_files)
                 
                 last_count = current_count
                 
                 # 检查是否完成
-                if current_count >= total_papers:
-                    print("🎉 所有文献分析完成！")
+                finished = current_count >= total_papers
+                if finished:
+                    lines.append("🎉 所有文献分析完成！")
+                
+                self._write_lines(lines)
+                if finished:
                     break
             
             # 检查最大监控时长
@@ -111,8 +290,13 @@ class ProgressMonitor:
                 print(f"⏰ 监控时长达到限制 ({max_duration}秒)，停止监控")
                 break
             
-            # 等待下次检查
-            time.sleep(self.check_interval)
+            # 等待下次检查：文件变化或调用stop()时立即唤醒
+            self._wake.wait(timeout=self.check_interval)
+            self._wake.clear()
+            
+            if self._stop.is_set():
+                print("👋 监控已停止")
+                break
 
 
 def check_progress(input_dir: str, output_dir: str):